@@ -3,20 +3,97 @@
 Setup script for Video Segment Annotator
 """
 
-import subprocess
+import argparse
+import hashlib
 import sys
 import os
-from pathlib import Path
 
-def install_requirements():
-    """Install required packages"""
+PIP_CMD = [sys.executable, "-m", "pip"]
+SETUP_STATE_FILE = ".setup_state"
+
+def pip_env():
+    """Environment for pip runs: no self-version check, no prompts, wheels preferred"""
+    env = os.environ.copy()
+    env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    env["PIP_NO_INPUT"] = "1"
+    env["PIP_PREFER_BINARY"] = "1"
+    return env
+
+def pip_needs_upgrade():
+    """Check whether the installed pip predates 23.0"""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        print("✅ Successfully installed requirements!")
+        from importlib.metadata import version
+        return int(version("pip").split(".")[0]) < 23
+    except Exception:
+        # Python 3.7 has no importlib.metadata; assume an old pip
         return True
-    except subprocess.CalledProcessError:
+
+def requirements_file():
+    """Return the requirements file to install from"""
+    # Hashed lock file (pip-compile --generate-hashes) lets pip reuse cached wheels as-is
+    return "requirements.lock" if os.path.isfile("requirements.lock") else "requirements.txt"
+
+def requirements_hash(path):
+    """Hash the requirements file together with the interpreter it is installed into"""
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+def requirements_up_to_date(path):
+    """Check whether the last successful install used this exact requirements file"""
+    try:
+        with open(SETUP_STATE_FILE) as f:
+            return f.read().strip() == requirements_hash(path)
+    except OSError:
+        return False
+
+def install_requirements():
+    """Install required packages"""
+    import subprocess
+    
+    req_file = requirements_file()
+    
+    # Pin the cache location so repeat runs reuse downloaded and built wheels
+    cmd = PIP_CMD + ["install", "--cache-dir", os.path.join(os.path.expanduser("~"), ".cache", "pip"),
+                     "-r", req_file]
+    if req_file == "requirements.lock":
+        cmd.append("--require-hashes")
+    elif pip_needs_upgrade():
+        # Bring pip/wheel up to date in the same run instead of a separate interpreter start
+        cmd += ["pip>=23", "wheel"]
+    
+    # With VSA_QUIET set, keep pip's progress output off the (possibly slow) terminal
+    # and only surface its errors if the install fails
+    output = {}
+    if os.environ.get("VSA_QUIET"):
+        cmd.append("-q")
+        output = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+    
+    result = subprocess.run(cmd, env=pip_env(), **output)
+    if result.returncode != 0:
+        if result.stderr:
+            sys.stderr.write(result.stderr.decode(errors="replace"))
         print("❌ Failed to install requirements")
         return False
+    
+    with open(SETUP_STATE_FILE, "w") as f:
+        f.write(requirements_hash(req_file))
+    print("✅ Successfully installed requirements!")
+    return True
+
+def existing_directories(roots):
+    """Collect the subdirectories of each root with a single scandir per root"""
+    existing = set()
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        existing.add(entry.name if root == "." else f"{root}/{entry.name}")
+        except FileNotFoundError:
+            continue
+    return existing
 
 def create_directories():
     """Create necessary directories"""
@@ -28,28 +105,44 @@ def create_directories():
         "unified_dataset/metadata"
     ]
     
-    for dir_path in dirs_to_create:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    # Only touch the filesystem for directories that are actually missing
+    existing = existing_directories([".", "segments", "unified_dataset"])
+    missing = [dir_path for dir_path in dirs_to_create
+               if dir_path not in existing and not os.path.isdir(dir_path)]
+    
+    # Create the whole missing batch in one pass. Shared parents come first so each
+    # leaf is a single mkdir instead of a makedirs walk that re-stats its parents.
+    parents = {dir_path.split("/")[0] for dir_path in missing if "/" in dir_path}
+    for dir_path in sorted(parents - existing) + missing:
+        try:
+            os.mkdir(dir_path)
+        except FileExistsError:
+            pass
     
     print("✅ Created directory structure!")
 
 def main():
+    if sys.version_info < (3, 7):
+        sys.exit("❌ Python 3.7 or higher is required")
+    
+    parser = argparse.ArgumentParser(description="Set up Video Segment Annotator")
+    parser.add_argument("--force", action="store_true",
+                        help="reinstall requirements even if they are unchanged since the last setup")
+    args = parser.parse_args()
+    
     print("🎬 Video Segment Annotator Setup")
     print("=" * 40)
     
-    # Check Python version
-    if sys.version_info < (3, 7):
-        print("❌ Python 3.7 or higher is required")
-        return
-    
-    print(f"✅ Python version: {sys.version}")
+    print("✅ Python version:", sys.version)
     
     # Create directories
     create_directories()
     
-    # Install requirements
-    if not install_requirements():
-        return
+    # Install requirements, skipping pip entirely when nothing changed since the last run
+    if not args.force and requirements_up_to_date(requirements_file()):
+        print("✅ Requirements unchanged since last setup (use --force to reinstall)")
+    elif not install_requirements():
+        sys.exit(1)
     
     print("\n🎉 Setup completed successfully!")
     print("\nNext steps:")
@@ -9,15 +9,131 @@ License: MIT
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import cv2
+import importlib
+import importlib.util
+import sys
 import os
+import stat
+import functools
 import json
 import shutil
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image, ImageTk
+import queue
 import threading
 import time
 
+def _lazy_import(name):
+    """Import a module on first attribute access instead of at import time"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return importlib.import_module(name)  # Raises the usual ModuleNotFoundError
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def _finish_imports(*modules):
+    """Load lazily imported modules now, so a missing or broken install raises its own ImportError"""
+    for module in modules:
+        getattr(module, "__file__", None)
+
+# OpenCV and NumPy take tens of milliseconds to load; defer that until a video is opened
+cv2 = _lazy_import("cv2")
+np = _lazy_import("numpy")
+
+try:
+    import orjson  # Optional: much faster JSON serialization and parsing for dataset summaries
+except ImportError:
+    orjson = None
+try:
+    import ijson  # Optional: reads single fields of large dataset summaries without loading them
+except ImportError:
+    ijson = None
+
+# Errors that mean a dataset summary can't be read (JSON decode errors subclass ValueError)
+SUMMARY_READ_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Forward jumps up to this many frames are reached with grab() instead of a keyframe seek
+GRAB_SEEK_LIMIT = 120
+# Number of recently shown preview frames kept so scrubbing back and forth skips decoding
+FRAME_CACHE_SIZE = 128
+# File name endings counted as extracted frames and segment videos (str.endswith tuples)
+FRAME_SUFFIXES = (".jpg",)
+# Extracted frames in a segment folder are frame_0001.jpg, ...; other JPEGs there aren't frames
+FRAME_PREFIX = "frame_"
+SEGMENT_VIDEO_SUFFIXES = (".mp4",)
+
+def _open_capture(path):
+    """Open a video for preview with FFmpeg, using hardware decoding when available"""
+    # Hardware acceleration has to be requested when the capture is opened; OpenCV
+    # silently falls back to software decoding if no accelerator is usable
+    # Looked up outside the try: on a broken OpenCV install this is where its ImportError
+    # surfaces, rather than inside an except clause that references the half-loaded module
+    opencv_error = cv2.error
+    try:
+        cap = cv2.VideoCapture(str(path), cv2.CAP_FFMPEG,
+                               [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        if cap.isOpened():
+            return cap
+        cap.release()
+    except (AttributeError, opencv_error):
+        pass  # OpenCV builds without FFmpeg or without the open-params API
+    return cv2.VideoCapture(str(path))
+
+def _dump_json(obj, path):
+    """Write obj to path as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2))
+
+def _dump_jsonl(header, records, path):
+    """Write header and then each record as one JSON object per line, using orjson when it is installed"""
+    dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+    Path(path).write_bytes(b"".join(dumps(obj) + b"\n" for obj in [header, *records]))
+
+def _loads_json(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying instead when linking isn't possible (e.g. across devices)"""
+    # Linking onto an existing name fails, so replace frames left from an earlier run
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _count_suffix(dirpath, suffixes, prefix=""):
+    """Count the files in dirpath named prefix...suffix (for any of suffixes), in a single scandir pass"""
+    with os.scandir(dirpath) as entries:
+        return sum(1 for entry in entries
+                   if entry.name.endswith(suffixes) and entry.name.startswith(prefix) and entry.is_file())
+
+def _probe(path):
+    """Return (exists, is_dir, mtime_ns, size) for path from a single os.stat call"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False, 0, 0  # Like Path.exists(): missing, a file in the way, unreadable
+    return True, stat.S_ISDIR(st.st_mode), st.st_mtime_ns, st.st_size
+
+@functools.lru_cache(maxsize=1024)
+def _cached_count(path, suffixes, mtime_ns, prefix=""):
+    """_count_suffix memoized per directory mtime, which changes whenever an entry is added or removed"""
+    return _count_suffix(path, suffixes, prefix)
+
 class VideoSegmentAnnotator:
     def __init__(self):
         self.root = tk.Tk()
@@ -27,13 +143,30 @@ class VideoSegmentAnnotator:
         # Video variables
         self.cap = None
         self.current_video_path = None
-        self.video_files = []
+        self._video_names = ()  # File names of the videos found in videos_dir, sorted
+        self._video_paths = ()  # Path strings matching _video_names
+        self._video_list_cache = None  # Formatted input-video block of the stats, rebuilt by load_videos
         self.current_video_index = 0
-        self.is_playing = False
         self.current_frame = 0
         self.total_frames = 0
         self.fps = 30
         self.video_duration = 0
+        self._decoded_frame_idx = -1  # Last frame read from self.cap (-1: stream at start, None: unknown)
+        self._shown_frame_idx = None  # Frame currently in the preview; playback can decode ahead of it
+        self._display_size = None  # (width, height) of the preview, fixed per video
+        self._photo = None  # Tk photo image reused for every frame of the current video
+        self._frame_cache = OrderedDict()  # frame index -> RGB preview, least recently used first
+        self._resize_buf = None  # Preallocated BGR preview buffer, reused for every resize
+        self._decimate_buf = None  # Preallocated 2x-preview buffer for large sources (None: not needed)
+        self._spare_frames = []  # RGB buffers evicted from the cache, reused for color conversion
+        self._cap_lock = threading.Lock()  # Serializes decoder access between Tk and playback threads
+        self._frame_queue = queue.Queue(maxsize=2)  # Preview frames decoded by the playback thread
+        self._stop_event = threading.Event()  # Set to stop the current playback thread; a fresh one per run
+        self._stop_event.set()
+        self._render_pending = False  # A _render_once call is already scheduled on the Tk thread
+        self._pending_seek = None  # after() id of the coalesced progress-bar seek, if any
+        self._prefetch_lock = threading.Lock()  # Guards self._prefetched
+        self._prefetched = None  # (path, capture, first frame) opened ahead of time for the next video
         
         # Annotation variables
         self.segments = []  # List of (start_time, end_time) tuples
@@ -44,6 +177,8 @@ class VideoSegmentAnnotator:
         self.progress_var = None
         self.time_var = None
         self.frame_info_var = None
+        self.stats_text = None  # Text widget of the open statistics window, if any
+        self._stats_stale = False  # A refresh was skipped while the statistics window was hidden
         
         # Project paths
         self.project_dir = Path(__file__).parent
@@ -51,6 +186,14 @@ class VideoSegmentAnnotator:
         self.segments_dir = self.project_dir / "segments"
         self.unified_dataset_dir = self.project_dir / "unified_dataset"
         
+        # Plain string paths for the statistics view, which only needs os-level checks
+        self._segments_frames_path = str(self.segments_dir / "frames")
+        self._segments_videos_path = str(self.segments_dir / "videos")
+        self._unified_dataset_path = str(self.unified_dataset_dir)
+        self._unified_images_path = str(self.unified_dataset_dir / "images")
+        self._unified_summary_path = str(self.unified_dataset_dir / "dataset_summary.jsonl")
+        self._unified_legacy_summary_path = str(self.unified_dataset_dir / "dataset_summary.json")
+        
         self.setup_directories()
         self.setup_ui()
         self.load_videos()
@@ -146,6 +289,7 @@ class VideoSegmentAnnotator:
         self.progress_bar = ttk.Scale(progress_frame, from_=0, to=100, orient=tk.HORIZONTAL, 
                                      variable=self.progress_var, command=self.on_progress_change)
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 10))
+        self.progress_bar.bind("<ButtonRelease-1>", self.on_progress_release)
         
         # Time display
         self.time_var = tk.StringVar(value="00:00 / 00:00")
@@ -218,34 +362,51 @@ class VideoSegmentAnnotator:
         if not self.videos_dir.exists():
             self.videos_dir.mkdir(exist_ok=True)
             
-        video_extensions = ['.mp4', '.avi', '.mov', '.MOV']
-        self.video_files = []
-        
-        for ext in video_extensions:
-            # Filter out hidden files (dot files)
-            self.video_files.extend([f for f in self.videos_dir.glob(f'*{ext}') 
-                                   if not f.name.startswith('.')])
-        
-        if not self.video_files:
+        video_extensions = {'.mp4', '.avi', '.mov'}
+        
+        # One directory pass for all extensions. Matching case-insensitively also keeps
+        # .mov/.MOV from being listed twice on case-insensitive filesystems.
+        # Names and paths are kept as parallel string tuples, so nothing downstream reparses paths
+        with os.scandir(self.videos_dir) as entries:
+            videos = sorted((entry.name, entry.path) for entry in entries
+                            if not entry.name.startswith('.')  # Filter out hidden files (dot files)
+                            and os.path.splitext(entry.name)[1].lower() in video_extensions
+                            and entry.is_file())
+        self._video_names, self._video_paths = zip(*videos) if videos else ((), ())
+        self._video_list_cache = None
+        
+        if not self._video_paths:
             self.video_info_label.config(text=f"No videos found in: {self.videos_dir}\nSupported formats: .mp4, .avi, .mov")
             self.status_var.set("No videos found - use 'Choose Video Folder' or add videos to the current folder")
             return
             
-        self.video_files.sort()
         self.current_video_index = 0
         self.load_current_video()
-        self.status_var.set(f"Loaded {len(self.video_files)} videos")
+        self.status_var.set(f"Loaded {len(self._video_paths)} videos")
         
     def load_current_video(self):
         """Load the current video"""
-        if not self.video_files:
+        if not self._video_paths:
             return
             
-        if self.cap:
-            self.cap.release()
-            
-        self.current_video_path = self.video_files[self.current_video_index]
-        self.cap = cv2.VideoCapture(str(self.current_video_path))
+        # Stop any playback thread before the decoder it reads from goes away
+        self.stop_playback()
+        
+        video_path = self._video_paths[self.current_video_index]
+        self.current_video_path = Path(video_path)
+        
+        # Use the capture opened in the background for this video if there is one
+        cap, first_frame = self._take_prefetched(video_path)
+        with self._cap_lock:
+            self._swap_cap(cap if cap is not None else _open_capture(self.current_video_path))
+            self._decoded_frame_idx = -1 if first_frame is None else 0
+            self._shown_frame_idx = None
+            self._display_size = None
+            self._photo = None
+            self._resize_buf = None
+            self._decimate_buf = None
+            self._spare_frames.clear()
+        self._frame_cache.clear()
         
         if not self.cap.isOpened():
             messagebox.showerror("Error", f"Could not open video: {self.current_video_path.name}")
@@ -257,131 +418,363 @@ class VideoSegmentAnnotator:
         self.video_duration = self.total_frames / self.fps if self.fps > 0 else 0
         
         # Update UI
-        video_info = f"Video {self.current_video_index + 1}/{len(self.video_files)}: {self.current_video_path.name} | "
+        video_info = f"Video {self.current_video_index + 1}/{len(self._video_paths)}: {self._video_names[self.current_video_index]} | "
         video_info += f"Duration: {self.format_time(self.video_duration)} | FPS: {self.fps:.1f} | Frames: {self.total_frames}"
         video_info += f"\nFolder: {self.videos_dir}"
         self.video_info_label.config(text=video_info)
         
         # Reset video state
         self.current_frame = 0
-        self.is_playing = False
         self.segments = []
         self.temp_start_time = None
-        self.play_button.config(text="▶")
+        
+        # The prefetched first frame is already decoded; seed the cache so it isn't read again
+        if first_frame is not None:
+            with self._cap_lock:
+                rgb = self._prepare_frame(first_frame)
+            self._cache_frame(0, rgb)
         
         # Update displays
         self.update_video_display()
         self.update_segments_display()
         self.status_var.set(f"Loaded: {self.current_video_path.name}")
         
+        # Open the next video while this one is being watched
+        if self.current_video_index < len(self._video_paths) - 1:
+            next_path = self._video_paths[self.current_video_index + 1]
+            threading.Thread(target=self._prefetch_video, args=(next_path,), daemon=True).start()
+            
+    def _swap_cap(self, new_cap):
+        """Replace self.cap, releasing the old decoder right away (call with self._cap_lock held)"""
+        if self.cap is not None:
+            self.cap.release()
+        self.cap = new_cap
+        
+    def _prefetch_video(self, path):
+        """Open a video and decode its first frame on a background thread"""
+        cap = _open_capture(path)
+        ret, frame = cap.read() if cap.isOpened() else (False, None)
+        with self._prefetch_lock:
+            stale, self._prefetched = self._prefetched, (path, cap, frame if ret else None)
+        if stale is not None:
+            stale[1].release()
+            
+    def _take_prefetched(self, path):
+        """Return the prefetched (capture, first frame) for path, or (None, None)"""
+        with self._prefetch_lock:
+            prefetched, self._prefetched = self._prefetched, None
+        if prefetched is None:
+            return None, None
+        prefetched_path, cap, frame = prefetched
+        if prefetched_path != path or not cap.isOpened():
+            cap.release()  # Prefetched for a video the user didn't move on to
+            return None, None
+        return cap, frame
+        
     def update_video_display(self):
         """Update the video frame display"""
         if not self.cap:
             return
             
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-        ret, frame = self.cap.read()
-        
-        if ret:
-            # Resize frame for display - more reasonable size
-            height, width = frame.shape[:2]
-            display_width = 600  # Reduced from 800
-            display_height = int(height * display_width / width)
-            
-            # Limit display height to prevent UI overflow
-            max_display_height = 350
-            if display_height > max_display_height:
-                display_height = max_display_height
-                display_width = int(width * display_height / height)
-            
-            frame_resized = cv2.resize(frame, (display_width, display_height))
-            
-            # Convert to RGB and then to PIL Image
-            frame_rgb = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(frame_rgb)
-            photo = ImageTk.PhotoImage(pil_image)
-            
-            # Update label
-            self.video_label.config(image=photo, text="")
-            self.video_label.image = photo  # Keep a reference
+        rgb = self._frame_cache.get(self.current_frame)
+        if rgb is not None:
+            self._frame_cache.move_to_end(self.current_frame)
+        else:
+            with self._cap_lock:
+                frame = self._decode_current()
+                rgb = self._prepare_frame(frame) if frame is not None else None
+            if rgb is not None:
+                self._cache_frame(self.current_frame, rgb)
+        if rgb is not None:
+            self._show_frame(self.current_frame, rgb)
             
-        # Update progress and time
-        current_time = self.current_frame / self.fps if self.fps > 0 else 0
-        progress = (self.current_frame / self.total_frames * 100) if self.total_frames > 0 else 0
+        self._update_progress()
         
+    def _update_progress(self):
+        """Update the progress bar, time and frame counter for the current frame"""
+        progress = (self.current_frame / self.total_frames * 100) if self.total_frames > 0 else 0
         self.progress_var.set(progress)
-        self.time_var.set(f"{self.format_time(current_time)} / {self.format_time(self.video_duration)}")
-        
-        # Update frame counter
-        self.frame_info_var.set(f"Frame: {self.current_frame + 1} / {self.total_frames}")
+        current_time = self._show_position(self.current_frame)
         
         # Update status with current position during playback
         if self.is_playing:
             self.status_var.set(f"Playing - Frame {self.current_frame + 1}/{self.total_frames} at {self.format_time(current_time)}")
         
+    def _show_position(self, frame_index):
+        """Update the time and frame counter labels, returning the time in seconds"""
+        current_time = frame_index / self.fps if self.fps > 0 else 0
+        self.time_var.set(f"{self.format_time(current_time)} / {self.format_time(self.video_duration)}")
+        self.frame_info_var.set(f"Frame: {frame_index + 1} / {self.total_frames}")
+        return current_time
+        
+    def _decode_current(self):
+        """Decode the current frame, returning None if it is already displayed or unreadable"""
+        # Compare against what is on screen, not the decoder position: playback decodes
+        # ahead, and a frame decoded but dropped on stop was never shown
+        if self.current_frame == self._shown_frame_idx:
+            return None
+        
+        # Only seek on random access; a seek restarts decoding from the nearest keyframe.
+        # Frames shortly ahead are reached with grab(), which skips color conversion and
+        # copying for the frames in between.
+        ahead = None if self._decoded_frame_idx is None else self.current_frame - self._decoded_frame_idx
+        if ahead is not None and 0 < ahead <= GRAB_SEEK_LIMIT:
+            for _ in range(ahead - 1):
+                self.cap.grab()
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
+        ret, frame = self.cap.read()
+        
+        # After a failed read the stream position is unknown, so force a seek next time
+        self._decoded_frame_idx = self.current_frame if ret else None
+        return frame if ret else None
+        
+    def _fit_display_size(self, width, height):
+        """Scale a frame size to fit the video player"""
+        # Resize frame for display - more reasonable size
+        display_width = 600  # Reduced from 800
+        display_height = int(height * display_width / width)
+        
+        # Limit display height to prevent UI overflow
+        max_display_height = 350
+        if display_height > max_display_height:
+            display_height = max_display_height
+            display_width = int(width * display_height / height)
+            
+        return display_width, display_height
+        
+    def _prepare_frame(self, frame):
+        """Convert a decoded BGR frame into an RGB preview image (call with self._cap_lock held)"""
+        # Every frame of a video has the same size, so compute the preview size and
+        # allocate the resize buffer once
+        if self._display_size is None:
+            height, width = frame.shape[:2]
+            self._display_size = self._fit_display_size(width, height)
+        if self._resize_buf is None:
+            display_width, display_height = self._display_size
+            self._resize_buf = np.empty((display_height, display_width, 3), np.uint8)
+            if frame.shape[1] > 2 * display_width:
+                self._decimate_buf = np.empty((2 * display_height, 2 * display_width, 3), np.uint8)
+        
+        # INTER_AREA averages every source pixel, which dominates the cost on HD/4K sources.
+        # Point-sample down to twice the preview size first so the area filter only averages
+        # 2x2 blocks.
+        if self._decimate_buf is not None:
+            frame = cv2.resize(frame, self._decimate_buf.shape[1::-1], dst=self._decimate_buf,
+                               interpolation=cv2.INTER_NEAREST)
+        
+        # Shrink first so the color conversion only touches the small buffer. The RGB
+        # result is kept by the frame cache, so it goes into a buffer the cache has evicted.
+        cv2.resize(frame, self._display_size, dst=self._resize_buf, interpolation=cv2.INTER_AREA)
+        try:
+            rgb = self._spare_frames.pop()
+        except IndexError:
+            rgb = None
+        return cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2RGB, dst=rgb)
+        
+    def _cache_frame(self, frame_index, rgb):
+        """Remember a preview frame, evicting the least recently used one when full"""
+        self._frame_cache[frame_index] = rgb
+        self._frame_cache.move_to_end(frame_index)
+        if len(self._frame_cache) > FRAME_CACHE_SIZE:
+            _, evicted = self._frame_cache.popitem(last=False)
+            self._spare_frames.append(evicted)
+            
+    def _show_frame(self, frame_index, rgb):
+        """Show the RGB preview image of a frame in the video label"""
+        self._shown_frame_idx = frame_index
+        # Allocate the Tk photo image once per video, then paste new frames into it
+        if self._photo is None:
+            self._photo = ImageTk.PhotoImage("RGB", self._display_size)
+            self.video_label.config(image=self._photo, text="")
+        self._photo.paste(Image.frombuffer("RGB", self._display_size, rgb, "raw", "RGB", 0, 1))
+        
     def format_time(self, seconds):
         """Format time in MM:SS format"""
         minutes = int(seconds // 60)
         seconds = int(seconds % 60)
         return f"{minutes:02d}:{seconds:02d}"
         
+    @property
+    def is_playing(self):
+        """Whether a playback run is active"""
+        return not self._stop_event.is_set()
+        
     def toggle_play(self):
         """Toggle play/pause"""
-        self.is_playing = not self.is_playing
-        self.play_button.config(text="⏸" if self.is_playing else "▶")
-        
         if self.is_playing:
+            self.stop_playback()
+        elif self.cap:
+            self.play_button.config(text="⏸")
             self.play_video()
             
+    def stop_playback(self):
+        """Stop playback and tell the playback thread to exit"""
+        self._stop_event.set()
+        self.play_button.config(text="▶")
+        
+    def _playback_period(self):
+        """Seconds between displayed frames during playback"""
+        # Faster playback - reduced frame time and adaptive to FPS
+        return max(1.0 / (self.fps * 1.5), 0.01) if self.fps > 0 else 0.033
+        
     def play_video(self):
-        """Play video in a separate thread with improved speed"""
-        def play_loop():
-            while self.is_playing and self.current_frame < self.total_frames - 1:
-                self.current_frame += 1
-                self.root.after(0, self.update_video_display)
+        """Play video, decoding on a background thread and displaying on the Tk main thread"""
+        if not self.cap:
+            return
+            
+        # Stop any previous run and give this one its own stop signal
+        self._stop_event.set()
+        stop_event = self._stop_event = threading.Event()
+        
+        # Drop frames left over from a previous run
+        while not self._frame_queue.empty():
+            self._frame_queue.get_nowait()
+            
+        # Position the decoder right after the frame on screen
+        with self._cap_lock:
+            if self._decoded_frame_idx != self.current_frame:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame + 1)
+                self._decoded_frame_idx = self.current_frame
                 
-                # Faster playback - reduced sleep time and adaptive to FPS
-                sleep_time = max(1.0 / (self.fps * 1.5), 0.01) if self.fps > 0 else 0.033
-                time.sleep(sleep_time)
+        threading.Thread(target=self._playback_worker, args=(stop_event,), daemon=True).start()
+        
+    def _playback_worker(self, stop_event):
+        """Decode and convert upcoming frames on the playback thread"""
+        period = self._playback_period()
+        next_tick = time.monotonic()
+        
+        while not stop_event.is_set():
+            with self._cap_lock:
+                if stop_event.is_set():
+                    break
+                frame_index = None if self._decoded_frame_idx is None else self._decoded_frame_idx + 1
+                ret = frame_index is not None and frame_index < self.total_frames
+                if ret:
+                    ret, frame = self.cap.read()
+                self._decoded_frame_idx = frame_index if ret else None
+                rgb = self._prepare_frame(frame) if ret else None
                 
-            if self.current_frame >= self.total_frames - 1:
-                self.is_playing = False
-                self.root.after(0, lambda: self.play_button.config(text="▶"))
-                self.root.after(0, lambda: self.status_var.set("Playback completed"))
+            # A None frame index tells the display side that the video has ended
+            item = (stop_event, frame_index if ret else None, rgb)
+            while not stop_event.is_set():
+                try:
+                    self._frame_queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+                    
+            # Ask Tk for a redraw only if none is pending, so a slow GUI doesn't pile up events
+            if not self._render_pending:
+                self._render_pending = True
+                self.root.after(0, self._render_once)
+            if not ret:
+                break
                 
-        if self.is_playing:
-            threading.Thread(target=play_loop, daemon=True).start()
+            # Pace against a monotonic deadline so decode time doesn't add up as drift
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+                continue
+                
+            # Running behind: drop whole frames with grab() (no conversion) to catch up
+            behind = int(-delay / period)
+            if behind:
+                with self._cap_lock:
+                    if stop_event.is_set():
+                        break
+                    for _ in range(min(behind, self.total_frames - 1 - self._decoded_frame_idx)):
+                        if not self.cap.grab():
+                            self._decoded_frame_idx = None
+                            break
+                        self._decoded_frame_idx += 1
+                next_tick += behind * period
+                
+    def _render_once(self):
+        """Display the newest frame produced by the playback thread"""
+        # Cleared before draining so a frame queued from here on schedules another render
+        self._render_pending = False
+        
+        latest = None
+        ended = False
+        while True:
+            try:
+                item_event, frame_index, rgb = self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item_event is not self._stop_event or item_event.is_set():
+                continue  # Decoded before a seek, restart or stop
+            if frame_index is None:
+                ended = True
+            else:
+                latest = (frame_index, rgb)
+                
+        if latest is not None:
+            self.current_frame, rgb = latest
+            self._cache_frame(self.current_frame, rgb)
+            self._show_frame(self.current_frame, rgb)
+            self._update_progress()
             
+        if ended:
+            self.stop_playback()
+            self.status_var.set("Playback completed")
+            
+    def _seek_to(self, target_frame):
+        """Jump to a frame (clamped to the video) and display it"""
+        # Stop the playback thread first so it can't read from the decoder mid-seek
+        was_playing = self.is_playing
+        self._stop_event.set()
+        
+        self.current_frame = max(0, min(target_frame, self.total_frames - 1))
+        self.update_video_display()
+        
+        # Restart playback from the new position so queued frames from before the seek are dropped
+        if was_playing:
+            self.play_video()
+        
     def seek_forward(self):
         """Seek forward 5 seconds"""
-        skip_frames = int(5 * self.fps)
-        self.current_frame = min(self.current_frame + skip_frames, self.total_frames - 1)
-        self.update_video_display()
+        self._seek_to(self.current_frame + int(5 * self.fps))
         
     def seek_backward(self):
         """Seek backward 5 seconds"""
-        skip_frames = int(5 * self.fps)
-        self.current_frame = max(self.current_frame - skip_frames, 0)
-        self.update_video_display()
+        self._seek_to(self.current_frame - int(5 * self.fps))
         
     def step_forward(self):
         """Step forward one frame"""
         if self.current_frame < self.total_frames - 1:
-            self.current_frame += 1
-            self.update_video_display()
+            self._seek_to(self.current_frame + 1)
         
     def step_backward(self):
         """Step backward one frame"""
         if self.current_frame > 0:
-            self.current_frame -= 1
-            self.update_video_display()
+            self._seek_to(self.current_frame - 1)
         
     def on_progress_change(self, value):
         """Handle progress bar changes"""
         if not self.is_playing:  # Only allow manual seeking when not playing
-            progress = float(value)
-            self.current_frame = int(progress / 100 * self.total_frames)
-            self.update_video_display()
+            target_frame = min(int(float(value) / 100 * self.total_frames), self.total_frames - 1)
+            self._show_position(target_frame)
+            
+            # Dragging emits an event per pixel; coalesce them so only the latest
+            # position within a 33 ms window is decoded
+            if self._pending_seek is not None:
+                self.root.after_cancel(self._pending_seek)
+            self._pending_seek = self.root.after(33, self._apply_pending_seek, target_frame)
+            
+    def _apply_pending_seek(self, target_frame):
+        """Decode the latest progress-bar position"""
+        self._pending_seek = None
+        self._seek_to(target_frame)
+            
+    def on_progress_release(self, event):
+        """Decode the frame the progress bar was released on"""
+        if not self.is_playing:
+            if self._pending_seek is not None:
+                self.root.after_cancel(self._pending_seek)
+                self._pending_seek = None
+            self._seek_to(int(self.progress_var.get() / 100 * self.total_frames))
             
     def mark_start(self):
         """Mark the start of a segment"""
@@ -430,9 +823,8 @@ class VideoSegmentAnnotator:
             
     def update_segments_display(self):
         """Update the segments display"""
-        # Clear existing items
-        for item in self.segments_tree.get_children():
-            self.segments_tree.delete(item)
+        # Clear existing items with a single Tk call
+        self.segments_tree.delete(*self.segments_tree.get_children())
             
         # Add segments
         for i, (start, end) in enumerate(self.segments):
@@ -445,13 +837,13 @@ class VideoSegmentAnnotator:
             
     def previous_video(self):
         """Load previous video"""
-        if self.video_files and self.current_video_index > 0:
+        if self._video_paths and self.current_video_index > 0:
             self.current_video_index -= 1
             self.load_current_video()
             
     def next_video(self):
         """Load next video"""
-        if self.video_files and self.current_video_index < len(self.video_files) - 1:
+        if self._video_paths and self.current_video_index < len(self._video_paths) - 1:
             self.current_video_index += 1
             self.load_current_video()
             
@@ -471,13 +863,10 @@ class VideoSegmentAnnotator:
                 self.status_var.set(f"Exporting segment {i+1}/{len(self.segments)}...")
                 self.root.update()
                 
-                # Create segment video
+                # Create segment video and extract its frames in one decode pass
                 segment_path = self.segments_dir / "videos" / f"{segment_name}.mp4"
-                self.create_segment_video(start_time, end_time, segment_path)
-                
-                # Extract frames from segment
                 segment_frames_dir = self.segments_dir / "frames" / segment_name
-                self.extract_segment_frames(segment_path, segment_frames_dir, start_time, end_time)
+                self.create_segment_and_frames(start_time, end_time, segment_path, segment_frames_dir)
                 
             messagebox.showinfo("Success", f"Exported {len(self.segments)} segments successfully!\n\nSegment videos: segments/videos/\nExtracted frames: segments/frames/")
             self.status_var.set(f"✅ Exported {len(self.segments)} segments from {video_name}")
@@ -485,13 +874,53 @@ class VideoSegmentAnnotator:
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
             self.status_var.set("❌ Export failed")
+        else:
+            # Outside the try: the files are written, so a statistics error isn't an export failure
+            self.refresh_dataset_stats()
+            
+    def create_segment_and_frames(self, start_time, end_time, video_out, frames_dir):
+        """Create a video segment and extract its frames in a single decode pass"""
+        video_out.parent.mkdir(parents=True, exist_ok=True)
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Drop frames from an earlier export of this segment so the count below is accurate
+        for old_frame in frames_dir.glob("frame_*.jpg"):
+            old_frame.unlink()
+        
+        # One FFmpeg run with two outputs fed by a single decode: the segment is re-encoded
+        # with x264 and the same frames are written as JPEGs. Seeking on the input before
+        # decoding keeps the cut frame-accurate (a stream copy would start at the previous
+        # keyframe), so the video, the frames and the metadata all cover the same range.
+        fps = None
+        if shutil.which("ffmpeg"):
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-nostdin", "-loglevel", "error",
+                 "-ss", str(start_time), "-to", str(end_time), "-i", str(self.current_video_path),
+                 "-map", "0:v:0", "-map", "0:a?", "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+                 "-pix_fmt", "yuv420p", "-c:a", "aac", str(video_out),
+                 "-map", "0:v:0", "-qscale:v", "2", str(frames_dir / "frame_%04d.jpg")],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if result.returncode == 0:
+                fps = self.fps
+                frame_count = _count_suffix(frames_dir, FRAME_SUFFIXES, FRAME_PREFIX)
+            else:
+                # e.g. an FFmpeg build without libx264; fall back to OpenCV
+                print(f"Warning: FFmpeg export failed, re-encoding with OpenCV: {result.stderr.decode(errors='replace').strip()}")
+                for partial_frame in frames_dir.glob("frame_*.jpg"):
+                    partial_frame.unlink()
+                    
+        if fps is None:
+            fps, frame_count = self.export_segment_with_opencv(start_time, end_time, video_out, frames_dir)
             
-    def create_segment_video(self, start_time, end_time, output_path):
-        """Create a video segment"""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_segment_metadata(video_out, frames_dir, start_time, end_time, fps, frame_count)
         
+    def export_segment_with_opencv(self, start_time, end_time, video_out, frames_dir):
+        """Decode a segment once with OpenCV, writing each frame to the video and as a JPEG"""
         cap = cv2.VideoCapture(str(self.current_video_path))
         
+        if not cap.isOpened():
+            raise Exception(f"Could not open video: {self.current_video_path}")
+            
         # Get video properties
         fps = cap.get(cv2.CAP_PROP_FPS)
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -499,52 +928,40 @@ class VideoSegmentAnnotator:
         
         # Set up video writer
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(str(output_path), fourcc, fps, (width, height))
+        out = cv2.VideoWriter(str(video_out), fourcc, fps, (width, height))
         
         # Calculate frame range
         start_frame = int(start_time * fps)
         end_frame = int(end_time * fps)
-        
-        # Extract frames
         cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
         
-        for frame_num in range(start_frame, end_frame):
-            ret, frame = cap.read()
-            if not ret:
-                break
-            out.write(frame)
-            
-        cap.release()
-        out.release()
-        
-    def extract_segment_frames(self, segment_path, output_dir, start_time, end_time):
-        """Extract frames from a segment video"""
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        cap = cv2.VideoCapture(str(segment_path))
-        
-        if not cap.isOpened():
-            raise Exception(f"Could not open segment video: {segment_path}")
-            
-        # Get video properties
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        
-        # Extract frames
+        # cv2.imwrite releases the GIL while encoding, so JPEGs are written on a thread pool.
+        # Only a few frames are kept in flight to bound memory use on long segments.
+        workers = min(4, os.cpu_count() or 1)
         frame_count = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for frame_num in range(start_frame, end_frame):
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                    
+                out.write(frame)
+                frame_count += 1
+                frame_path = frames_dir / f"frame_{frame_count:04d}.jpg"
+                pending.append(executor.submit(cv2.imwrite, str(frame_path), frame))
+                if len(pending) >= 2 * workers:
+                    pending.popleft().result()
+                    
+            for write in pending:
+                write.result()
                 
-            frame_name = f"frame_{frame_count+1:04d}.jpg"
-            frame_path = output_dir / frame_name
-            cv2.imwrite(str(frame_path), frame)
-            frame_count += 1
-            
         cap.release()
+        out.release()
+        return fps, frame_count
         
-        # Save metadata
+    def write_segment_metadata(self, video_out, frames_dir, start_time, end_time, fps, frame_count):
+        """Save the metadata for an exported segment"""
         metadata = {
             "original_video": self.current_video_path.name,
             "segment_start_time": start_time,
@@ -553,14 +970,13 @@ class VideoSegmentAnnotator:
             "fps": fps,
             "total_frames": frame_count,
             "extracted_frames": frame_count,
-            "segment_video_path": str(segment_path.relative_to(self.project_dir)),
-            "frames_directory": str(output_dir.relative_to(self.project_dir))
+            "segment_video_path": str(video_out.relative_to(self.project_dir)),
+            "frames_directory": str(frames_dir.relative_to(self.project_dir))
         }
         
-        metadata_path = output_dir / "metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-            
+        metadata_path = frames_dir / "metadata.json"
+        _dump_json(metadata, metadata_path)
+        
     def create_unified_dataset(self):
         """Create a unified dataset from all extracted frames"""
         frames_dir = self.segments_dir / "frames"
@@ -588,88 +1004,89 @@ class VideoSegmentAnnotator:
         self.root.update()
         
         total_frames_copied = 0
-        dataset_summary = {
-            "total_frames": 0,
-            "total_segments": len(segment_folders),
-            "creation_timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "segments": []
-        }
+        all_frame_names = []
+        creation_timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        segments_summary = []
+        
+        # Frames are hardlinked instead of copied (falling back to a copy across filesystems)
+        # and processed on a thread pool, so the dataset costs per-file metadata operations
+        # rather than rewriting every JPEG
+        def add_frame(frame_pair):
+            frame_file, dest_frame_path = frame_pair
+            try:
+                _link_or_copy(frame_file, dest_frame_path)
+                return True
+            except Exception as e:
+                print(f"Error: Could not copy {frame_file.name}: {e}")
+                return False
         
         # Process each segment folder
-        for i, segment_folder in enumerate(segment_folders):
-            segment_name = segment_folder.name
-            self.status_var.set(f"Processing segment {i+1}/{len(segment_folders)}: {segment_name}")
-            self.root.update()
-            
-            # Get all frame files from this segment
-            frame_files = list(segment_folder.glob("frame_*.jpg"))
-            frame_files.sort()
-            
-            # Copy metadata if it exists
-            metadata_file = segment_folder / "metadata.json"
-            segment_metadata = {}
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    segment_metadata = json.load(f)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for i, segment_folder in enumerate(segment_folders):
+                segment_name = segment_folder.name
+                self.status_var.set(f"Processing segment {i+1}/{len(segment_folders)}: {segment_name}")
+                self.root.update()
                 
-                # Copy metadata file with segment name
-                dest_metadata_path = dataset_metadata_dir / f"{segment_name}_metadata.json"
-                shutil.copy2(metadata_file, dest_metadata_path)
-            
-            frames_in_segment = 0
-            
-            # Copy each frame with unique naming
-            for frame_file in frame_files:
-                # Create unique frame name: segment_name + original frame name
-                new_frame_name = f"{segment_name}_{frame_file.name}"
-                dest_frame_path = dataset_images_dir / new_frame_name
+                # Get all frame files from this segment
+                frame_files = sorted(segment_folder.glob("frame_*.jpg"))
                 
-                # Copy the frame with error handling
-                try:
-                    shutil.copy2(frame_file, dest_frame_path)
-                    frames_in_segment += 1
-                    total_frames_copied += 1
-                except Exception as e:
-                    print(f"Warning: Could not copy {frame_file.name}: {e}")
-                    try:
-                        shutil.copy(frame_file, dest_frame_path)
-                        frames_in_segment += 1
-                        total_frames_copied += 1
-                    except Exception as e2:
-                        print(f"Error: Could not copy {frame_file.name}: {e2}")
-                        continue
-            
-            # Add segment info to summary
-            segment_info = {
-                "segment_name": segment_name,
-                "frames_count": frames_in_segment,
-                "metadata": segment_metadata
-            }
-            dataset_summary["segments"].append(segment_info)
-        
-        # Update total frames in summary
-        dataset_summary["total_frames"] = total_frames_copied
-        
-        # Save dataset summary
-        summary_path = self.unified_dataset_dir / "dataset_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(dataset_summary, f, indent=2)
-        
-        # Create a simple text file with frame list for easy reference
+                # Copy metadata if it exists
+                metadata_file = segment_folder / "metadata.json"
+                segment_metadata = {}
+                if metadata_file.exists():
+                    with open(metadata_file, 'r') as f:
+                        segment_metadata = json.load(f)
+                    
+                    # Copy metadata file with segment name
+                    dest_metadata_path = dataset_metadata_dir / f"{segment_name}_metadata.json"
+                    shutil.copy2(metadata_file, dest_metadata_path)
+                
+                # Add each frame with unique naming: segment_name + original frame name
+                frame_pairs = [(frame_file, dataset_images_dir / f"{segment_name}_{frame_file.name}")
+                               for frame_file in frame_files]
+                added = list(executor.map(add_frame, frame_pairs))
+                all_frame_names.extend(dest.name for (_, dest), ok in zip(frame_pairs, added) if ok)
+                frames_in_segment = sum(added)
+                total_frames_copied += frames_in_segment
+                
+                # Add segment info to summary
+                segment_info = {
+                    "segment_name": segment_name,
+                    "frames_count": frames_in_segment,
+                    "metadata": segment_metadata
+                }
+                segments_summary.append(segment_info)
+        
+        # Save dataset summary as JSON Lines: a header with the totals first, then one line
+        # per segment, so readers that only need the header never parse the segment list
+        dataset_header = {
+            "total_frames": total_frames_copied,
+            "total_segments": len(segment_folders),
+            "creation_timestamp": creation_timestamp
+        }
+        summary_path = self.unified_dataset_dir / "dataset_summary.jsonl"
+        _dump_jsonl(dataset_header, segments_summary, summary_path)
+        
+        # The JSON summary written by earlier versions would now be out of date
+        try:
+            os.unlink(self._unified_legacy_summary_path)
+        except FileNotFoundError:
+            pass
+        
+        # Create a simple text file with frame list for easy reference; the names are
+        # already known from the loop above, so the images folder isn't rescanned
         frame_list_path = self.unified_dataset_dir / "frame_list.txt"
-        frame_files = list(dataset_images_dir.glob("*.jpg"))
-        frame_files.sort()
+        all_frame_names.sort()
         
         with open(frame_list_path, 'w') as f:
             f.write(f"Unified Video Dataset\n")
             f.write(f"Generated by Video Segment Annotator\n")
-            f.write(f"Total Frames: {len(frame_files)}\n")
+            f.write(f"Total Frames: {len(all_frame_names)}\n")
             f.write(f"Total Segments: {len(segment_folders)}\n")
             f.write(f"Created: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"\nFrame Files:\n")
             f.write("=" * 50 + "\n")
-            for frame_file in frame_files:
-                f.write(f"{frame_file.name}\n")
+            f.write("".join(f"{name}\n" for name in all_frame_names))
         
         messagebox.showinfo("Success", 
             f"Unified dataset created successfully!\n\n"
@@ -678,13 +1095,13 @@ class VideoSegmentAnnotator:
             f"💾 Location: unified_dataset/\n\n"
             f"Images: unified_dataset/images/\n"
             f"Metadata: unified_dataset/metadata/\n"
-            f"Summary: unified_dataset/dataset_summary.json")
+            f"Summary: unified_dataset/dataset_summary.jsonl")
         
         self.status_var.set(f"✅ Created unified dataset with {total_frames_copied} frames from {len(segment_folders)} segments")
+        self.refresh_dataset_stats()
     
     def open_output_folder(self):
         """Open the output folder in file explorer"""
-        import subprocess
         import platform
         
         if platform.system() == "Windows":
@@ -696,106 +1113,169 @@ class VideoSegmentAnnotator:
     
     def show_dataset_stats(self):
         """Show dataset statistics"""
-        stats_text = self.get_dataset_statistics()
-        
-        # Create a new window for stats
-        stats_window = tk.Toplevel(self.root)
-        stats_window.title("Dataset Statistics")
-        stats_window.geometry("600x400")
-        
-        # Text widget with scrollbar
-        text_frame = ttk.Frame(stats_window)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        text_widget = tk.Text(text_frame, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        text_widget.insert(tk.END, stats_text)
-        text_widget.config(state=tk.DISABLED)
+        # Reuse the statistics window if it is still open
+        if self.stats_text is not None:
+            stats_window = self.stats_text.winfo_toplevel()
+            stats_window.deiconify()
+            stats_window.lift()
+        else:
+            # Create a new window for stats
+            stats_window = tk.Toplevel(self.root)
+            stats_window.title("Dataset Statistics")
+            stats_window.geometry("600x400")
+            
+            # Text widget with scrollbar
+            text_frame = ttk.Frame(stats_window)
+            text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            text_widget = tk.Text(text_frame, wrap=tk.WORD)
+            scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
+            text_widget.configure(yscrollcommand=scrollbar.set)
+            
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            self.stats_text = text_widget
+            text_widget.bind("<Destroy>", self.on_stats_closed)
+            text_widget.bind("<Map>", self.on_stats_mapped)
+            
+        self._render_stats()
+        
+    def _render_stats(self):
+        """Replace the statistics window's contents with freshly built statistics"""
+        # Single-insert contract: the statistics are built as one string and go into the
+        # widget with one delete and one insert, so Tk lays the text out once per refresh
+        self._stats_stale = False
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete("1.0", tk.END)
+        self.stats_text.insert(tk.END, self.get_dataset_statistics())
+        self.stats_text.config(state=tk.DISABLED)
+        
+    def on_stats_closed(self, event):
+        """Forget the statistics window once it is closed"""
+        self.stats_text = None
+        
+    def on_stats_mapped(self, event):
+        """Catch up on refreshes skipped while the statistics window was hidden"""
+        if self._stats_stale:
+            self._render_stats()
+            
+    def refresh_dataset_stats(self):
+        """Update the statistics window after the dataset on disk changed"""
+        # Rebuilding means rescanning the output folders, so skip it when the window is
+        # closed, minimized or otherwise not on screen; a hidden window catches up on <Map>
+        if self.stats_text is None:
+            return
+        if not self.stats_text.winfo_ismapped():
+            self._stats_stale = True
+            return
+        self._render_stats()
         
     def get_dataset_statistics(self):
         """Get comprehensive dataset statistics"""
-        stats = []
-        stats.append("📊 VIDEO SEGMENT ANNOTATOR - DATASET STATISTICS\n")
-        stats.append("=" * 60 + "\n\n")
+        # One stat per path up front; the results answer both "is it there" and "has it changed"
+        _, frames_is_dir, _, _ = _probe(self._segments_frames_path)
+        _, videos_is_dir, videos_mtime, _ = _probe(self._segments_videos_path)
+        _, dataset_is_dir, _, _ = _probe(self._unified_dataset_path)
+        _, images_is_dir, images_mtime, _ = _probe(self._unified_images_path)
+        summary_exists, summary_is_dir, _, summary_size = _probe(self._unified_summary_path)
         
         # Check for segments
-        segments_frames_dir = self.segments_dir / "frames"
-        segments_videos_dir = self.segments_dir / "videos"
-        
-        if segments_frames_dir.exists():
-            segment_folders = [f for f in segments_frames_dir.iterdir() if f.is_dir()]
-            stats.append(f"📁 Extracted Segments: {len(segment_folders)}\n")
+        n_segments = 0
+        n_frames = 0
+        if frames_is_dir:
+            with os.scandir(self._segments_frames_path) as entries:
+                segment_folders = [(entry.path, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()]
+            n_segments = len(segment_folders)
+            n_frames = sum(_cached_count(folder, FRAME_SUFFIXES, mtime_ns, FRAME_PREFIX) for folder, mtime_ns in segment_folders)
             
-            total_frames = 0
-            for folder in segment_folders:
-                frame_count = len(list(folder.glob("frame_*.jpg")))
-                total_frames += frame_count
-            
-            stats.append(f"🖼️  Total Extracted Frames: {total_frames}\n")
-        else:
-            stats.append("📁 Extracted Segments: 0\n")
-            stats.append("🖼️  Total Extracted Frames: 0\n")
-        
-        if segments_videos_dir.exists():
-            video_files = list(segments_videos_dir.glob("*.mp4"))
-            stats.append(f"🎥 Segment Videos: {len(video_files)}\n")
-        else:
-            stats.append("🎥 Segment Videos: 0\n")
+        n_videos = _cached_count(self._segments_videos_path, SEGMENT_VIDEO_SUFFIXES, videos_mtime) if videos_is_dir else 0
         
         # Check for unified dataset
-        if self.unified_dataset_dir.exists():
-            dataset_images_dir = self.unified_dataset_dir / "images"
-            summary_file = self.unified_dataset_dir / "dataset_summary.json"
+        if dataset_is_dir:
+            n_unified = _cached_count(self._unified_images_path, FRAME_SUFFIXES, images_mtime) if images_is_dir else 0
+            unified = f"📊 Unified Dataset Frames: {n_unified}\n"
             
-            if dataset_images_dir.exists():
-                unified_frames = list(dataset_images_dir.glob("*.jpg"))
-                stats.append(f"📊 Unified Dataset Frames: {len(unified_frames)}\n")
+            created = None
+            if summary_exists and not summary_is_dir:
+                if summary_size < 2:
+                    created = 'Unknown'  # Empty or truncated; nothing to parse
+                else:
+                    try:
+                        # The timestamp is in the header on the first line; segment lines are never read
+                        with open(self._unified_summary_path, 'rb') as f:
+                            header = _loads_json(f.readline())
+                        # Valid JSON that isn't an object (e.g. a list) has no timestamp to read
+                        created = header.get('creation_timestamp', 'Unknown') if isinstance(header, dict) else 'Unknown'
+                    except SUMMARY_READ_ERRORS:
+                        pass  # Unreadable or corrupt summary; leave the timestamp out
             else:
-                stats.append("📊 Unified Dataset Frames: 0\n")
-                
-            if summary_file.exists():
-                try:
-                    with open(summary_file, 'r') as f:
-                        summary = json.load(f)
-                    stats.append(f"📅 Dataset Created: {summary.get('creation_timestamp', 'Unknown')}\n")
-                except:
-                    pass
+                created = self._legacy_summary_timestamp()
+            if created is not None:
+                unified += f"📅 Dataset Created: {created}\n"
         else:
-            stats.append("📊 Unified Dataset: Not created\n")
-        
-        stats.append(f"\n📂 Project Directory: {self.project_dir}\n")
-        stats.append(f"🎬 Videos Directory: {self.videos_dir}\n")
-        stats.append(f"📤 Segments Directory: {self.segments_dir}\n")
-        stats.append(f"📊 Dataset Directory: {self.unified_dataset_dir}\n")
-        
-        # Input videos stats
-        video_count = len(self.video_files)
-        stats.append(f"\n🎬 Input Videos Available: {video_count}\n")
-        
-        if video_count > 0:
-            stats.append("\nInput Video Files:\n")
-            for i, video_path in enumerate(self.video_files):
-                stats.append(f"  {i+1}. {video_path.name}\n")
-        
-        return "".join(stats)
-        
+            unified = "📊 Unified Dataset: Not created\n"
+            
+        # Input videos stats; the list only changes when load_videos runs, so format it once
+        if self._video_list_cache is None:
+            video_count = len(self._video_names)
+            header = "\nInput Video Files:\n" if video_count > 0 else ""
+            video_lines = "".join(f"  {i}. {name}\n" for i, name in enumerate(self._video_names, 1))
+            self._video_list_cache = f"\n🎬 Input Videos Available: {video_count}\n{header}{video_lines}"
+            
+        return (f"📊 VIDEO SEGMENT ANNOTATOR - DATASET STATISTICS\n"
+                f"{'=' * 60}\n\n"
+                f"📁 Extracted Segments: {n_segments}\n"
+                f"🖼️  Total Extracted Frames: {n_frames}\n"
+                f"🎥 Segment Videos: {n_videos}\n"
+                f"{unified}"
+                f"\n📂 Project Directory: {self.project_dir}\n"
+                f"🎬 Videos Directory: {self.videos_dir}\n"
+                f"📤 Segments Directory: {self.segments_dir}\n"
+                f"📊 Dataset Directory: {self.unified_dataset_dir}\n"
+                f"{self._video_list_cache}")
+        
+    def _legacy_summary_timestamp(self):
+        """Read the creation timestamp from a dataset_summary.json written by earlier versions"""
+        summary_file = self._unified_legacy_summary_path
+        summary_exists, summary_is_dir, _, summary_size = _probe(summary_file)
+        if not summary_exists or summary_is_dir:
+            return None
+        if summary_size < 2:
+            return 'Unknown'  # Empty or truncated; nothing to parse
+            
+        try:
+            # Only the timestamp is needed: stream large summaries so the segment list
+            # is never built, but load small ones whole where streaming is slower
+            if ijson is not None and summary_size >= 64_000:
+                with open(summary_file, 'rb') as f:
+                    return next((value for key, value in ijson.kvitems(f, '')
+                                 if key == 'creation_timestamp'), 'Unknown')
+            with open(summary_file, 'rb') as f:
+                summary = _loads_json(f.read())
+            return summary.get('creation_timestamp', 'Unknown') if isinstance(summary, dict) else 'Unknown'
+        except SUMMARY_READ_ERRORS:
+            return None  # Unreadable or corrupt summary; leave the timestamp out
+            
     def run(self):
         """Run the application"""
-        self.root.mainloop()
-        
-        # Cleanup
-        if self.cap:
-            self.cap.release()
+        try:
+            self.root.mainloop()
+        finally:
+            # Cleanup, even if the UI loop raised
+            self._stop_event.set()
+            with self._cap_lock:
+                self._swap_cap(None)
+            self._take_prefetched(None)  # Releases a capture opened ahead for the next video
 
 def main():
     """Main function to run the Video Segment Annotator"""
-    print("🎬 Starting Video Segment Annotator...")
-    print("📁 Make sure to place your video files in the 'videos' folder")
+    if not os.environ.get("VSA_QUIET"):
+        print("🎬 Starting Video Segment Annotator...")
+        print("📁 Make sure to place your video files in the 'videos' folder")
+    
+    # Fail before the window opens if OpenCV or NumPy can't be loaded
+    _finish_imports(cv2, np)
     
     app = VideoSegmentAnnotator()
     app.run()